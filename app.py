@@ -1,194 +1,562 @@
 """Flask-based RPG Chatbot Application"""
+import hashlib
 import json
+import logging
+import logging.handlers
+import queue
+import struct
+import threading
 import time
+import zlib
+import requests
+from types import MappingProxyType
+from typing import NamedTuple
 from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from config import Config
-from game_logic import GameState, ConversationFormatter
+from game_logic import GameState
 from chatbot import ChatClient
 
+# Optional: orjson is much faster than stdlib json for the per-token SSE payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: msgpack enables a compact binary wire format for streaming clients
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _configure_nonblocking_logging():
+    """Route log records through a queue drained by a background thread.
+
+    The project modules log eagerly during streaming; with direct stream
+    handlers every record pays its write inside the worker that is
+    mid-token. A QueueHandler makes emitting a record a queue put, and
+    the listener thread does the actual I/O.
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(
+        isinstance(h, logging.handlers.QueueHandler) for h in root.handlers
+    ):
+        return
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+
+
+_configure_nonblocking_logging()
+
 app = Flask(__name__)
+# The css/js bundles change rarely; let browsers cache them for a day
+# instead of revalidating (and re-sending) them on every page load
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400
+
+
+def sse(payload: dict) -> bytes:
+    """Serialize a payload dict into a single SSE frame (bytes)"""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
+    return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
+
+
+def _request_json() -> dict:
+    """Parse the request body as JSON (orjson when available)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(request.get_data())
+        except orjson.JSONDecodeError:
+            return {}
+    return request.get_json(silent=True) or {}
+
+
+class GameRequest(NamedTuple):
+    """Typed view of the fields shared by the game endpoints"""
+    provider: str
+    model: str
+    api_key: str
+    api_url: str
+    session_id: str
+    max_steps: int
+    delay: int
+
+
+def _as_int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_game_request(data: dict, default_max_steps: int = 10, default_delay: int = 1) -> GameRequest:
+    """Extract and type-coerce the request payload in a single pass"""
+    return GameRequest(
+        provider=str(data.get('provider', 'Groq')),
+        model=str(data.get('model', 'llama-3.1-8b-instant')),
+        api_key=str(data.get('api_key', '')),
+        api_url=str(data.get('api_url', '')),
+        session_id=str(data.get('session_id', 'default')),
+        max_steps=_as_int(data.get('max_steps'), default_max_steps),
+        delay=_as_int(data.get('delay'), default_delay),
+    )
+
+
+def _wants_msgpack() -> bool:
+    """Check whether the client asked for msgpack frames and we can serve them"""
+    if msgpack is None:
+        return False
+    # Explicit opt-in only: best_match would also fire on a wildcard
+    # Accept (which is what a plain fetch() sends), and the stock
+    # frontend can only parse SSE frames
+    return any(
+        value == 'application/msgpack' and quality > 0
+        for value, quality in request.accept_mimetypes
+    )
+
 
-# Store game states per session (in production, use proper session management)
-game_sessions = {}
+def _coalesce_chunks(events, interval=0.05):
+    """Merge bursts of chunk events so each client write carries more text.
+
+    Fast providers emit hundreds of tiny deltas per second, and writing a
+    frame per delta costs more in serialization and syscalls than it adds
+    in smoothness. Chunks arriving within `interval` seconds of the last
+    flush are concatenated; any other event type flushes first and passes
+    through unchanged.
+    """
+    pending = None
+    last_flush = 0.0
+    for event in events:
+        if event.get('type') == 'chunk':
+            if pending is not None and event.get('choice') == pending.get('choice'):
+                pending['content'] += event['content']
+            else:
+                if pending is not None:
+                    yield pending
+                    last_flush = time.monotonic()
+                pending = dict(event)
+            if time.monotonic() - last_flush >= interval:
+                yield pending
+                pending = None
+                last_flush = time.monotonic()
+        else:
+            if pending is not None:
+                yield pending
+                pending = None
+            yield event
+            last_flush = time.monotonic()
+
+    if pending is not None:
+        yield pending
+
+
+def _prefetch(events, maxsize=64):
+    """Run the event producer in a worker thread, buffering ahead.
+
+    The game generators block on the provider's HTTP stream while the
+    response path spends its time on formatting, serialization and
+    socket writes. Pulling events through a small queue lets the next
+    token arrive over the network while the current one is being sent,
+    instead of serializing the two waits.
+    """
+    q = queue.Queue(maxsize)
+    done = object()
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for event in events:
+                if stop.is_set():
+                    return
+                q.put(event)
+            q.put(done)
+        except BaseException as exc:  # hand the error to the consumer
+            q.put(exc)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Client went away (or error): release a producer blocked on put()
+        stop.set()
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+
+def _accepts_gzip() -> bool:
+    return 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+
+
+def _gzip_stream(chunks):
+    """Gzip a byte stream incrementally.
+
+    The SSE frames are repetitive text, so gzip typically shrinks them
+    several-fold. Z_SYNC_FLUSH after every chunk keeps the stream live —
+    each frame reaches the client immediately instead of sitting in the
+    compressor buffer.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_response(events) -> Response:
+    """Stream payload dicts in the negotiated wire format.
+
+    Default is JSON-in-SSE, gzipped when the client advertises support.
+    Clients that send `Accept: application/msgpack` get length-prefixed
+    MessagePack frames instead (smaller and faster to encode for long
+    autoplay streams).
+    """
+    events = _coalesce_chunks(_prefetch(events))
+    if _wants_msgpack():
+        def frames():
+            for payload in events:
+                buf = msgpack.packb(payload)
+                yield struct.pack(">I", len(buf)) + buf
+        return Response(stream_with_context(frames()), mimetype='application/msgpack')
+
+    body = (sse(payload) for payload in events)
+    headers = {}
+    if _accepts_gzip():
+        body = _gzip_stream(body)
+        headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+    return Response(
+        stream_with_context(body),
+        mimetype='text/event-stream',
+        headers=headers,
+    )
+
+
+class SessionStore:
+    """Process-local store for GameState objects, keyed by session id.
+
+    Access goes through a small get/set/delete API guarded by a lock
+    (Flask serves requests from multiple threads), so an external backend
+    such as Redis could replace this class without touching the endpoints.
+
+    Browsers rotate session ids and only /api/reset ever removed entries,
+    so the plain dict was a slow memory leak. The store is bounded: at most
+    `maxsize` sessions are kept (least recently used evicted first) and
+    sessions idle for longer than `ttl` seconds expire.
+    """
+
+    def __init__(self, maxsize=10_000, ttl=3600):
+        self._lock = threading.Lock()
+        self._games = {}  # session_id -> (game, last_access) in LRU order
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def _expire(self, now):
+        # dicts preserve insertion order, so the oldest entries come first
+        for session_id, (_, last_access) in list(self._games.items()):
+            if now - last_access < self._ttl:
+                break
+            del self._games[session_id]
+
+    def get(self, session_id):
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._games.pop(session_id, None)
+            if entry is None:
+                return None
+            self._games[session_id] = (entry[0], now)  # move to MRU position
+            return entry[0]
+
+    def set(self, session_id, game):
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._games.pop(session_id, None)
+            self._games[session_id] = (game, now)
+            while len(self._games) > self._maxsize:
+                del self._games[next(iter(self._games))]
+
+    def delete(self, session_id):
+        with self._lock:
+            self._games.pop(session_id, None)
+
+
+# Store game states per session
+game_sessions = SessionStore()
+
+
+def format_incremental(game, conversation):
+    """Format a conversation for the client without walking the history.
+
+    GameState maintains ``gradio_conversation`` on write, so the committed
+    part of the history is already in client shape. Only the streamed tail
+    (the in-flight turn) needs formatting on top of it.
+
+    Always returns a copy: the result crosses the _prefetch thread
+    boundary, and the producer keeps mutating ``gradio_conversation``
+    (in place, pair by pair) while the consumer may still be serializing.
+    """
+    result = [list(pair) for pair in game.gradio_conversation]
+    extra = conversation[len(game.conversation):]
+    if not extra:
+        return result
+
+    for speaker, content in extra:
+        if speaker == "GM":
+            if result and result[-1][0] is not None and result[-1][1] is None:
+                # Pair the streamed GM reply with the pending player choice
+                result[-1] = [result[-1][0], content]
+            else:
+                result.append([None, content])
+        else:
+            result.append([content, None])
+    return result
+
+
+# Provider settings are static, so build the table once at import time
+# instead of rebuilding the nested dict on every request
+_PROVIDER_CONFIGS = {
+    "OpenAI (GPT)": {
+        "api_url": "https://api.openai.com/v1/chat/completions",
+        "default_model": "gpt-4o-mini",
+        "models": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
+        "requires_key": True,
+        "provider": "openai",
+    },
+    "Anthropic (Claude)": {
+        "api_url": "https://api.anthropic.com/v1/messages",
+        "default_model": "claude-3-haiku-20240307",
+        "models": [
+            "claude-3-5-sonnet-20241022",
+            "claude-3-haiku-20240307",
+            "claude-3-opus-20240229",
+        ],
+        "requires_key": True,
+        "provider": "anthropic",
+    },
+    "Google (Gemini)": {
+        "api_url": "https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
+        "default_model": "gemini-2.0-flash",
+        "models": [
+            "gemini-2.5-flash-lite",
+            "gemini-2.0-flash",
+            "gemini-2.0-flash-lite",
+        ],
+        "requires_key": True,
+        "provider": "gemini",
+    },
+    "DeepSeek": {
+        "api_url": "https://api.deepseek.com/chat/completions",
+        "default_model": "deepseek-chat",
+        "models": [
+            "deepseek-chat",
+            "deepseek-coder",
+            "deepseek-reasoner",
+        ],
+        "requires_key": True,
+        "provider": "deepseek",
+    },
+    "Ollama (Local)": {
+        "api_url": "http://localhost:11434/v1/chat/completions",
+        "default_model": "llama3.1",
+        "models": [
+            "llama3.1",
+            "llama3:latest",
+            "mistral",
+            "codellama",
+            "vicuna",
+            "gemma:2b",
+        ],
+        "requires_key": False,
+        "provider": "ollama",
+    },
+    "Groq": {
+        "api_url": "https://api.groq.com/openai/v1/chat/completions",
+        "default_model": "llama-3.1-8b-instant",
+        "models": [
+            "llama-3.1-8b-instant",
+            "meta-llama/llama-4-scout-17b-16e-instruct",
+            "gemma2-9b-it",
+        ],
+        "requires_key": True,
+        "provider": "groq",
+    },
+    "LM Studio": {
+        "api_url": "http://localhost:1234/v1/chat/completions",
+        "default_model": "local-model",
+        "models": ["local-model"],
+        "requires_key": False,
+        "provider": "lmstudio",
+    },
+    "Custom Provider": {
+        "api_url": "",
+        "default_model": "custom-model",
+        "models": ["custom-model"],
+        "requires_key": True,
+        "provider": "custom",
+    },
+}
 
 
 def get_provider_config(provider_name: str) -> dict:
     """Get configuration for a specific provider"""
-    provider_configs = {
-        "OpenAI (GPT)": {
-            "api_url": "https://api.openai.com/v1/chat/completions",
-            "default_model": "gpt-4o-mini",
-            "models": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
-            "requires_key": True,
-            "provider": "openai",
-        },
-        "Anthropic (Claude)": {
-            "api_url": "https://api.anthropic.com/v1/messages",
-            "default_model": "claude-3-haiku-20240307",
-            "models": [
-                "claude-3-5-sonnet-20241022",
-                "claude-3-haiku-20240307",
-                "claude-3-opus-20240229",
-            ],
-            "requires_key": True,
-            "provider": "anthropic",
-        },
-        "Google (Gemini)": {
-            "api_url": "https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
-            "default_model": "gemini-2.0-flash",
-            "models": [
-                "gemini-2.5-flash-lite",
-                "gemini-2.0-flash",
-                "gemini-2.0-flash-lite",
-            ],
-            "requires_key": True,
-            "provider": "gemini",
-        },
-        "DeepSeek": {
-            "api_url": "https://api.deepseek.com/chat/completions",
-            "default_model": "deepseek-chat",
-            "models": [
-                "deepseek-chat",
-                "deepseek-coder",
-                "deepseek-reasoner",
-            ],
-            "requires_key": True,
-            "provider": "deepseek",
-        },
-        "Ollama (Local)": {
-            "api_url": "http://localhost:11434/v1/chat/completions",
-            "default_model": "llama3.1",
-            "models": [
-                "llama3.1",
-                "llama3:latest",
-                "mistral",
-                "codellama",
-                "vicuna",
-                "gemma:2b",
-            ],
-            "requires_key": False,
-            "provider": "ollama",
-        },
-        "Groq": {
-            "api_url": "https://api.groq.com/openai/v1/chat/completions",
-            "default_model": "llama-3.1-8b-instant",
-            "models": [
-                "llama-3.1-8b-instant",
-                "meta-llama/llama-4-scout-17b-16e-instruct",
-                "gemma2-9b-it",
-            ],
-            "requires_key": True,
-            "provider": "groq",
-        },
-        "LM Studio": {
-            "api_url": "http://localhost:1234/v1/chat/completions",
-            "default_model": "local-model",
-            "models": ["local-model"],
-            "requires_key": False,
-            "provider": "lmstudio",
-        },
-        "Custom Provider": {
-            "api_url": "",
-            "default_model": "custom-model",
-            "models": ["custom-model"],
-            "requires_key": True,
-            "provider": "custom",
-        },
-    }
-    return provider_configs.get(provider_name, provider_configs["Custom Provider"])
+    return _PROVIDER_CONFIGS.get(provider_name, _PROVIDER_CONFIGS["Custom Provider"])
+
+
+def _json_bytes(payload) -> bytes:
+    """Serialize a payload to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# The provider endpoint serves static config, so serialize each response once
+# (from the plain dicts, before they are frozen below)
+_PROVIDER_JSON = {name: _json_bytes(cfg) for name, cfg in _PROVIDER_CONFIGS.items()}
+
+# Freeze the table: get_provider_config hands out shared references, and
+# read-only views make an accidental mutation by a caller raise instead of
+# corrupting the config for every other request
+_PROVIDER_CONFIGS = MappingProxyType({
+    name: MappingProxyType({**cfg, "models": tuple(cfg["models"])})
+    for name, cfg in _PROVIDER_CONFIGS.items()
+})
+
+
+# One pooled HTTP session shared by every ChatClient, so repeat steps
+# reuse warm TCP/TLS connections without sharing the clients themselves.
+# ChatClient carries per-game state (chat_logger, is_final_step, caches),
+# so handing the same instance to two sessions would cross their wires.
+_http_session = requests.Session()
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_http_session.mount("http://", _http_adapter)
+_http_session.mount("https://", _http_adapter)
+
+
+def _key_digest(api_key: str) -> bytes:
+    """Short opaque digest of an API key, safe to keep in cache keys"""
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).digest()
 
 
 def create_client(provider_name, model_name, api_url="", api_key=""):
     """Create a ChatClient for the selected provider"""
     provider_config = get_provider_config(provider_name)
-    url = api_url.strip() if api_url.strip() else provider_config["api_url"]
+    url = api_url.strip() or provider_config["api_url"]
+    key = api_key.strip() if api_key else ""
 
-    client = ChatClient(model=model_name)
+    client = ChatClient(model=model_name, session=_http_session)
     client.api_url = url
-    client.api_key = api_key.strip() if api_key else ""
+    client.api_key = key
     client.api_provider = provider_config["provider"]
     return client
 
 
-def _default_gm_prompt() -> str:
-    return (
-        "You are a vivid and safety-conscious RPG Game Master. "
-        "Set each scene with clear, engaging description (about 3–4 lines). "
-        "Always end your response with exactly four numbered choices (1–4), "
-        "each being concise, meaningful, and distinct."
-    )
+def _ensure_client(game, provider, model, api_url, api_key):
+    """Attach a client to the game, reusing the current one when settings match"""
+    key = (provider, model, api_url, _key_digest(api_key))
+    if getattr(game, '_client_key', None) != key:
+        game.chat_client = create_client(provider, model, api_url, api_key)
+        game.chat_client.chat_logger = game.chat_logger
+        game._client_key = key
+
 
+_DEFAULT_GM_PROMPT = (
+    "You are a vivid and safety-conscious RPG Game Master. "
+    "Set each scene with clear, engaging description (about 3–4 lines). "
+    "Always end your response with exactly four numbered choices (1–4), "
+    "each being concise, meaningful, and distinct."
+)
 
-def _default_player_prompt() -> str:
-    return "You are the Player. Your choices are numbers 1-4 responding to the GM options."
+_DEFAULT_PLAYER_PROMPT = "You are the Player. Your choices are numbers 1-4 responding to the GM options."
+
+
+# The dropdown lists every configured provider, in the table's order
+_PROVIDER_NAMES = tuple(_PROVIDER_CONFIGS)
 
 
 @app.route('/')
 def index():
     """Serve the main page"""
-    providers = [
-        "OpenAI (GPT)",
-        "Anthropic (Claude)",
-        "Google (Gemini)",
-        "DeepSeek",
-        "Ollama (Local)",
-        "Groq",
-        "LM Studio",
-        "Custom Provider",
-    ]
-    return render_template('index.html', providers=providers)
+    return render_template('index.html', providers=_PROVIDER_NAMES)
 
 
 @app.route('/api/provider/<provider_name>')
 def get_provider(provider_name):
     """Get provider configuration"""
-    config = get_provider_config(provider_name)
-    return jsonify(config)
+    body = _PROVIDER_JSON.get(provider_name, _PROVIDER_JSON["Custom Provider"])
+    return Response(
+        body,
+        mimetype='application/json',
+        headers={'Cache-Control': 'public, max-age=86400'},
+    )
 
 
 @app.route('/api/start', methods=['POST'])
 def start_game():
     """Start a new game and stream the initial response"""
-    data = request.json
-    provider = data.get('provider', 'Groq')
-    model = data.get('model', 'llama-3.1-8b-instant')
-    api_key = data.get('api_key', '')
-    api_url = data.get('api_url', '')
-    session_id = data.get('session_id', 'default')
+    req = parse_game_request(_request_json())
+    provider, model = req.provider, req.model
+    api_key, api_url = req.api_key, req.api_url
+    session_id = req.session_id
 
     def generate():
         try:
-            client = create_client(provider, model, api_url, api_key)
-            gm_prompt = _default_gm_prompt()
-            player_prompt = _default_player_prompt()
-            game = GameState(gm_prompt, player_prompt, chat_client=client)
-            game_sessions[session_id] = game
+            # First frame goes out before any client/session setup so the
+            # browser shows progress immediately
+            yield ({'type': 'status', 'message': 'Starting adventure...'})
+
+            game = game_sessions.get(session_id)
+            if game is not None:
+                # Swap the client before reset(): reset() starts the new log
+                # session, and its header must record the provider actually
+                # selected for this run, not the previous one
+                _ensure_client(game, provider, model, api_url, api_key)
+                # Reuse the session's GameState: reset() clears the story but
+                # keeps the logger and conversation buffers allocated
+                game.reset()
+            else:
+                client = create_client(provider, model, api_url, api_key)
+                game = GameState(_DEFAULT_GM_PROMPT, _DEFAULT_PLAYER_PROMPT, chat_client=client)
+                game._client_key = (provider, model, api_url, _key_digest(api_key))
+                game_sessions.set(session_id, game)
 
             for success, conversation, response in game.start_game_streaming():
                 if success:
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': response, 'conversation': ConversationFormatter.to_gradio_format(conversation)})}\n\n"
+                    yield ({'type': 'chunk', 'content': response})
                 else:
-                    yield f"data: {json.dumps({'type': 'error', 'message': response})}\n\n"
+                    yield ({'type': 'error', 'message': response})
                     return
 
-            yield f"data: {json.dumps({'type': 'done', 'step': game.step_count})}\n\n"
+            yield ({'type': 'turn', 'conversation': format_incremental(game, game.conversation)})
+            yield ({'type': 'done', 'step': game.step_count})
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield ({'type': 'error', 'message': str(e)})
 
-    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+    return stream_response(generate())
 
 
 @app.route('/api/step', methods=['POST'])
 def next_step():
     """Take the next step in the game"""
-    data = request.json
-    session_id = data.get('session_id', 'default')
-    max_steps = data.get('max_steps', 10)
-    provider = data.get('provider', 'Groq')
-    model = data.get('model', 'llama-3.1-8b-instant')
-    api_key = data.get('api_key', '')
-    api_url = data.get('api_url', '')
+    req = parse_game_request(_request_json())
+    provider, model = req.provider, req.model
+    api_key, api_url = req.api_key, req.api_url
+    session_id, max_steps = req.session_id, req.max_steps
 
     game = game_sessions.get(session_id)
     if not game:
@@ -196,96 +564,103 @@ def next_step():
 
     def generate():
         try:
-            # Update client for this step
-            client = create_client(provider, model, api_url, api_key)
-            game.chat_client = client
+            # Update client for this step (no-op when settings are unchanged)
+            _ensure_client(game, provider, model, api_url, api_key)
 
             for success, conversation, choice, response in game.take_step_streaming(max_steps=max_steps):
                 if success:
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': response, 'choice': choice, 'conversation': ConversationFormatter.to_gradio_format(conversation)})}\n\n"
+                    yield ({'type': 'chunk', 'content': response, 'choice': choice})
                 else:
-                    yield f"data: {json.dumps({'type': 'error', 'message': response})}\n\n"
+                    yield ({'type': 'error', 'message': response})
                     return
 
+            yield ({'type': 'turn', 'conversation': format_incremental(game, game.conversation)})
             is_complete = game.step_count >= max_steps
-            yield f"data: {json.dumps({'type': 'done', 'step': game.step_count, 'complete': is_complete})}\n\n"
+            yield ({'type': 'done', 'step': game.step_count, 'complete': is_complete})
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield ({'type': 'error', 'message': str(e)})
 
-    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+    return stream_response(generate())
 
 
 @app.route('/api/autoplay', methods=['POST'])
 def autoplay():
     """Auto-play the game"""
-    data = request.json
-    max_steps = data.get('max_steps', 5)
-    delay = data.get('delay', 1)
-    provider = data.get('provider', 'Groq')
-    model = data.get('model', 'llama-3.1-8b-instant')
-    api_key = data.get('api_key', '')
-    api_url = data.get('api_url', '')
-    session_id = data.get('session_id', 'default')
+    req = parse_game_request(_request_json(), default_max_steps=5)
+    provider, model = req.provider, req.model
+    api_key, api_url = req.api_key, req.api_url
+    session_id, max_steps, delay = req.session_id, req.max_steps, req.delay
 
     def generate():
         try:
-            client = create_client(provider, model, api_url, api_key)
-            gm_prompt = _default_gm_prompt()
-            player_prompt = _default_player_prompt()
-            game = GameState(gm_prompt, player_prompt, chat_client=client)
-            game_sessions[session_id] = game
-
-            # Start game
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Starting adventure...'})}\n\n"
+            # First frame goes out before any client/session setup so the
+            # browser shows progress immediately
+            yield ({'type': 'status', 'message': 'Starting adventure...'})
+
+            game = game_sessions.get(session_id)
+            if game is not None:
+                # Swap the client before reset(): reset() starts the new log
+                # session, and its header must record the provider actually
+                # selected for this run, not the previous one
+                _ensure_client(game, provider, model, api_url, api_key)
+                # Reuse the session's GameState: reset() clears the story but
+                # keeps the logger and conversation buffers allocated
+                game.reset()
+            else:
+                client = create_client(provider, model, api_url, api_key)
+                game = GameState(_DEFAULT_GM_PROMPT, _DEFAULT_PLAYER_PROMPT, chat_client=client)
+                game._client_key = (provider, model, api_url, _key_digest(api_key))
+                game_sessions.set(session_id, game)
 
             for success, conversation, response in game.start_game_streaming():
                 if not success:
-                    yield f"data: {json.dumps({'type': 'error', 'message': response})}\n\n"
+                    yield ({'type': 'error', 'message': response})
                     return
-                yield f"data: {json.dumps({'type': 'chunk', 'content': response, 'conversation': ConversationFormatter.to_gradio_format(conversation)})}\n\n"
+                yield ({'type': 'chunk', 'content': response})
 
-            yield f"data: {json.dumps({'type': 'step_done', 'step': 0})}\n\n"
+            yield ({'type': 'turn', 'conversation': format_incremental(game, game.conversation)})
+            yield ({'type': 'step_done', 'step': 0})
 
             if delay > 0:
-                time.sleep(delay)
+                # Pacing happens client-side so the worker thread stays free
+                yield ({'type': 'wait', 'ms': int(delay * 1000)})
 
             # Auto-play steps
             while game.step_count < max_steps:
-                yield f"data: {json.dumps({'type': 'status', 'message': f'Step {game.step_count + 1}/{max_steps}...'})}\n\n"
+                yield ({'type': 'status', 'message': f'Step {game.step_count + 1}/{max_steps}...'})
 
                 for success, conversation, choice, response in game.take_step_streaming(max_steps=max_steps):
                     if not success:
-                        yield f"data: {json.dumps({'type': 'error', 'message': response})}\n\n"
+                        yield ({'type': 'error', 'message': response})
                         return
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': response, 'choice': choice, 'conversation': ConversationFormatter.to_gradio_format(conversation)})}\n\n"
+                    yield ({'type': 'chunk', 'content': response, 'choice': choice})
 
-                yield f"data: {json.dumps({'type': 'step_done', 'step': game.step_count})}\n\n"
+                yield ({'type': 'turn', 'conversation': format_incremental(game, game.conversation)})
+                yield ({'type': 'step_done', 'step': game.step_count})
 
                 if game.step_count >= max_steps:
                     break
 
                 if delay > 0:
-                    time.sleep(delay)
+                    yield ({'type': 'wait', 'ms': int(delay * 1000)})
 
-            yield f"data: {json.dumps({'type': 'complete', 'step': game.step_count})}\n\n"
+            yield ({'type': 'complete', 'step': game.step_count})
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield ({'type': 'error', 'message': str(e)})
 
-    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+    return stream_response(generate())
 
 
 @app.route('/api/reset', methods=['POST'])
 def reset_game():
     """Reset the game"""
-    data = request.json
-    session_id = data.get('session_id', 'default')
+    session_id = str(_request_json().get('session_id', 'default'))
 
-    if session_id in game_sessions:
-        del game_sessions[session_id]
+    game_sessions.delete(session_id)
 
-    return jsonify({'status': 'reset'})
+    return Response(_json_bytes({'status': 'reset'}), mimetype='application/json')
 
 
 if __name__ == '__main__':
@@ -294,6 +669,6 @@ if __name__ == '__main__':
     app.run(
         host=Config.SERVER_HOST,
         port=Config.SERVER_PORT,
-        debug=True,
+        debug=Config.DEBUG,
         threaded=True
     )
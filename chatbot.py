@@ -1,4 +1,5 @@
 import requests
+import hashlib
 import json
 import re
 import time
@@ -8,6 +9,13 @@ import unicodedata
 from typing import List, Dict, Generator, Any, Optional
 from config import Config, ErrorMessages
 
+# Optional: orjson decodes the per-token stream chunks several times
+# faster than stdlib json (falls back transparently when not installed)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,7 +24,7 @@ logger = logging.getLogger(__name__)
 class ChatClient:
     """Universal chat client that auto-detects and adapts to any API provider"""
 
-    def __init__(self, model: Optional[str] = None):
+    def __init__(self, model: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_url = Config.API_URL
         self.model = model or Config.MODEL
         self.api_provider = Config.API_PROVIDER
@@ -27,6 +35,28 @@ class ChatClient:
         self._detected_provider = None
         self.is_final_step = False  # Add flag for final step handling
 
+        # Pooled HTTP session so repeated calls reuse TCP/TLS connections
+        # instead of paying a fresh handshake per game step. A Session is
+        # thread-safe for requests, so callers may pass in a shared one to
+        # pool connections across clients; everything else on a ChatClient
+        # (chat_logger, is_final_step, caches) is per-client state.
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        # Last test_connection result, cached briefly to avoid repeating
+        # the live round-trip on back-to-back checks (e.g. reloads)
+        self._connection_check = None  # (result dict, monotonic timestamp)
+
+        # Replay cache for deterministic sampling (temperature 0 only):
+        # identical histories then yield identical replies, so a revisited
+        # game state can skip the model round-trip entirely
+        self._response_cache = {}
+
     def _get_effective_api_key(self) -> str:
         """Get the effective API key, prioritizing dynamically set key"""
         # First check if api_key was set dynamically (from UI)
@@ -298,6 +328,11 @@ class ChatClient:
             if "max_tokens" not in payload or payload.get("max_tokens") is None:
                 payload["max_tokens"] = 1024  # Ensure complete responses for Gemini
 
+        # Ollama: keep the model resident between turns so the next step
+        # reuses the warm KV cache instead of paying a cold load + prefill
+        if self._detected_provider == "ollama":
+            payload["keep_alive"] = Config.OLLAMA_KEEP_ALIVE
+
         return payload
 
     def _build_anthropic_payload(
@@ -367,6 +402,15 @@ class ChatClient:
 
         return headers
 
+    RESPONSE_CACHE_SIZE = 32  # replay-cache entries kept per client
+
+    def _deterministic_cache_key(self, messages: List[Dict[str, str]]) -> Optional[bytes]:
+        """Cache key for a message history, or None when sampling is random"""
+        if self.ai_settings.get("temperature") != 0:
+            return None
+        raw = json.dumps([self.model, messages], sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
     def chat_streaming(self, messages: List[Dict[str, str]]) -> Generator[str, None, None]:
         """Streaming chat with robust final step handling and emergency logging"""
         try:
@@ -414,6 +458,14 @@ class ChatClient:
 
             # Regular streaming for non-final steps
             logger.info("=== REGULAR STREAMING START ===")
+            cache_key = self._deterministic_cache_key(messages)
+            if cache_key is not None:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Replaying deterministic response from cache")
+                    yield cached
+                    return
+
             payload = self._build_payload(messages, stream=True)
             headers = self._build_headers()
 
@@ -423,7 +475,7 @@ class ChatClient:
 
             response = None
             try:
-                response = requests.post(
+                response = self._session.post(
                     self.api_url,
                     json=payload,
                     headers=headers,
@@ -437,7 +489,7 @@ class ChatClient:
                 logger.info("Falling back to non-streaming approach")
                 payload["stream"] = False
                 try:
-                    response = requests.post(
+                    response = self._session.post(
                         self.api_url, json=payload, headers=headers, timeout=self.timeout
                     )
                     response.raise_for_status()
@@ -456,35 +508,46 @@ class ChatClient:
             full_content = ""
             chunk_count = 0
 
-            if payload.get("stream"):
-                logger.info("Processing streaming response...")
-                for content_chunk in self._parse_stream_response_simple(response):
-                    if content_chunk:
-                        chunk_count += 1
-                        full_content += content_chunk
-                        logger.debug(f"Chunk {chunk_count}: {len(content_chunk)} chars")
-                        yield content_chunk
-            else:
-                logger.info("Processing non-streaming response...")
-                try:
-                    result = response.json()
-                    content = (
-                        result.get("choices", [{}])[0]
-                        .get("message", {})
-                        .get("content", "")
-                    )
-                    if content:
-                        full_content = content
-                        logger.info(f"Non-streaming content: {len(content)} chars")
-                        yield content
-                    else:
-                        logger.warning("No content found in non-streaming response")
-                except (json.JSONDecodeError, KeyError, IndexError) as e:
-                    logger.error(f"Error parsing response: {e}")
-                    yield f"Error parsing response: {e}"
+            try:
+                if payload.get("stream"):
+                    logger.info("Processing streaming response...")
+                    for content_chunk in self._parse_stream_response_simple(response):
+                        if content_chunk:
+                            chunk_count += 1
+                            full_content += content_chunk
+                            logger.debug(f"Chunk {chunk_count}: {len(content_chunk)} chars")
+                            yield content_chunk
+                else:
+                    logger.info("Processing non-streaming response...")
+                    try:
+                        result = response.json()
+                        content = (
+                            result.get("choices", [{}])[0]
+                            .get("message", {})
+                            .get("content", "")
+                        )
+                        if content:
+                            full_content = content
+                            logger.info(f"Non-streaming content: {len(content)} chars")
+                            yield content
+                        else:
+                            logger.warning("No content found in non-streaming response")
+                    except (json.JSONDecodeError, KeyError, IndexError) as e:
+                        logger.error(f"Error parsing response: {e}")
+                        yield f"Error parsing response: {e}"
+            finally:
+                # Release the pooled connection promptly, even when the
+                # downstream consumer (e.g. a disconnected browser) closes
+                # this generator mid-stream
+                response.close()
 
             logger.info(f"Regular streaming complete. Total chunks: {chunk_count}, total chars: {len(full_content)}")
 
+            if cache_key is not None and full_content.strip():
+                if len(self._response_cache) >= self.RESPONSE_CACHE_SIZE:
+                    self._response_cache.pop(next(iter(self._response_cache)))
+                self._response_cache[cache_key] = full_content
+
             if not full_content.strip():
                 logger.warning("Empty response received, using fallback")
                 fallback_msg = "The GM seems silent... but the adventure continues!"
@@ -502,27 +565,68 @@ class ChatClient:
         """Simplified stream parsing to avoid encoding issues"""
         is_anthropic = self._detected_provider == "anthropic"
 
-        for raw_line in response.iter_lines(decode_unicode=False):
-            if not raw_line:
+        # Read sized chunks and split lines from a byte buffer ourselves:
+        # iter_lines re-buffers byte-by-byte per line, which costs real CPU
+        # at fast-provider token rates
+        buffer = bytearray()
+        done = False
+        for chunk in response.iter_content(chunk_size=4096):
+            if not chunk:
+                continue
+            buffer += chunk
+            if b"\n" not in chunk:
                 continue
 
-            try:
-                line = raw_line.decode("utf-8").strip()
-            except UnicodeDecodeError:
-                continue  # Skip problematic lines
-
-            # Handle Anthropic SSE events
-            if line.startswith("event:"):
-                continue  # Skip event type lines
+            pending = buffer.split(b"\n")
+            buffer = bytearray(pending.pop())  # keep the trailing partial line
 
-            if line.startswith("data: "):
-                data = line[6:].strip()
-                if data in ("[DONE]", "data: [DONE]"):
+            for raw_line in pending:
+                content, done = self._stream_line_content(raw_line, is_anthropic)
+                if content:
+                    yield content
+                if done:
                     break
-                if data:
-                    content = self._extract_content_simple(data, is_anthropic)
-                    if content:
-                        yield content
+
+            if done:
+                break
+
+        # Some servers end the stream without a trailing newline; flush the
+        # leftover bytes as a final line so the last data frame isn't dropped
+        if buffer and not done:
+            content, _ = self._stream_line_content(bytes(buffer), is_anthropic)
+            if content:
+                yield content
+
+    def _stream_line_content(self, raw_line: bytes, is_anthropic: bool):
+        """Extract content from one raw stream line; returns (content, done)"""
+        if not raw_line:
+            return "", False
+
+        try:
+            line = raw_line.decode("utf-8").strip()
+        except UnicodeDecodeError:
+            return "", False  # Skip problematic lines
+
+        # Handle Anthropic SSE events
+        if line.startswith("event:"):
+            return "", False  # Skip event type lines
+
+        if line.startswith("data: "):
+            data = line[6:].strip()
+            if data in ("[DONE]", "data: [DONE]"):
+                return "", True
+            if data:
+                return self._extract_content_simple(data, is_anthropic), False
+        return "", False
+
+    # Common paths to the content field across OpenAI-compatible providers,
+    # checked in order of likelihood on the streaming path
+    _CONTENT_PATHS = (
+        ("choices", 0, "delta", "content"),
+        ("choices", 0, "message", "content"),
+        ("message", "content"),
+        ("response",),
+    )
 
     def _extract_content_simple(self, json_str: str, is_anthropic: bool = False) -> str:
         """Simplified content extraction with Anthropic support"""
@@ -530,7 +634,10 @@ class ChatClient:
             return ""
 
         try:
-            data = json.loads(json_str)
+            if orjson is not None:
+                data = orjson.loads(json_str)
+            else:
+                data = json.loads(json_str)
 
             # Handle Anthropic streaming format specifically
             if is_anthropic:
@@ -547,15 +654,7 @@ class ChatClient:
                 # Skip other event types (message_start, content_block_start, etc.)
                 return ""
 
-            # Try common paths for OpenAI-compatible content
-            paths_to_try = [
-                ["choices", 0, "delta", "content"],
-                ["choices", 0, "message", "content"],
-                ["message", "content"],
-                ["response"],
-            ]
-
-            for path in paths_to_try:
+            for path in self._CONTENT_PATHS:
                 try:
                     value = data
                     for key in path:
@@ -576,7 +675,7 @@ class ChatClient:
                 except (KeyError, IndexError, TypeError):
                     continue
 
-        except json.JSONDecodeError:
+        except ValueError:  # covers both json and orjson decode errors
             pass
 
         return ""
@@ -593,7 +692,7 @@ class ChatClient:
                 logger.info(f"Payload max_tokens: {payload.get('max_tokens', 'not set')}")
                 logger.info(f"Payload temperature: {payload.get('temperature', 'not set')}")
 
-            response = requests.post(
+            response = self._session.post(
                 self.api_url, json=payload, headers=headers, timeout=self.timeout
             )
 
@@ -655,8 +754,20 @@ class ChatClient:
             logger.error(f"Non-streaming error: {e}")
             return f"Request failed: {str(e)}"
 
+    CONNECTION_CHECK_TTL = 60  # seconds a test_connection verdict stays valid
+
     def test_connection(self) -> Dict[str, Any]:
-        """Test API connection with auto-detection"""
+        """Test API connection with auto-detection (result cached briefly)"""
+        cached = self._connection_check
+        if cached is not None and time.monotonic() - cached[1] < self.CONNECTION_CHECK_TTL:
+            return cached[0]
+
+        result = self._test_connection_uncached()
+        self._connection_check = (result, time.monotonic())
+        return result
+
+    def _test_connection_uncached(self) -> Dict[str, Any]:
+        """Perform the live connection round-trip"""
         try:
             # Simple test message
             test_messages = [{"role": "user", "content": "Hi"}]
@@ -673,7 +784,7 @@ class ChatClient:
                 f"Using API key: {'Yes' if self._get_effective_api_key() else 'No'}"
             )
 
-            response = requests.post(
+            response = self._session.post(
                 self.api_url, json=test_payload, headers=headers, timeout=10
             )
 
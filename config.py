@@ -48,6 +48,7 @@ class Config:
     # Server Configuration with sensible defaults
     SERVER_HOST = os.getenv("SERVER_HOST", "localhost")
     SERVER_PORT = _safe_int.__func__(os.getenv("SERVER_PORT"), 7860)
+    DEBUG = _safe_bool.__func__(os.getenv("FLASK_DEBUG"), False)
     SHARE_GRADIO = _safe_bool.__func__(os.getenv("SHARE_GRADIO"), False)
 
     # Game Settings with defaults
@@ -58,6 +59,8 @@ class Config:
 
     # Request Configuration
     REQUEST_TIMEOUT = _safe_int.__func__(os.getenv("REQUEST_TIMEOUT"), 30)
+    # How long Ollama keeps the model (and its KV cache) loaded between turns
+    OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
     # File Paths
     PROMPTS_DIR = os.getenv("PROMPTS_DIR", ".")
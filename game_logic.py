@@ -78,6 +78,7 @@ class GameState:
     def __init__(self, gm_prompt: str, player_prompt: str, model_name: Optional[str] = None, chat_client=None):
         self.gm_history = [{"role": "system", "content": gm_prompt}]
         self.conversation = []
+        self.gradio_conversation = []
         self.step_count = 0
         self.chat_logger = ChatLogger()
 
@@ -95,16 +96,35 @@ class GameState:
 
     def _start_session_with_model_info(self):
         """Start a new chat session with model information"""
+        # ChatClient always defines these in __init__, so plain attribute
+        # access is safe and skips the defaulted-getattr lookups
+        client = self.chat_client
         model_info = {
-            'provider': getattr(self.chat_client, 'api_provider', 'unknown'),
-            'model': getattr(self.chat_client, 'model', 'unknown'),
-            'api_url': getattr(self.chat_client, 'api_url', 'unknown'),
-            'temperature': getattr(self.chat_client, 'ai_settings', {}).get('temperature', None),
-            'max_tokens': getattr(self.chat_client, 'ai_settings', {}).get('max_tokens', None)
+            'provider': client.api_provider,
+            'model': client.model,
+            'api_url': client.api_url,
+            'temperature': client.ai_settings.get('temperature'),
+            'max_tokens': client.ai_settings.get('max_tokens')
         }
         self.chat_logger.start_new_session(model_info)
         logger.info(f"Started new session with {model_info['provider']} / {model_info['model']}")
 
+    def append_message(self, speaker: str, content: str):
+        """Record a committed message and update the gradio-shape view.
+
+        Maintaining the [user, bot] pairs on write keeps reads O(1) —
+        the streaming loops no longer reformat the whole history per token.
+        """
+        self.conversation.append((speaker, content))
+        pairs = self.gradio_conversation
+        if speaker == "GM" and pairs and pairs[-1][0] is not None and pairs[-1][1] is None:
+            # GM reply answers the pending player choice
+            pairs[-1][1] = content
+        elif speaker == "GM":
+            pairs.append([None, content])
+        else:
+            pairs.append([content, None])
+
     def start_game_streaming(self) -> Generator[Tuple[bool, List, str], None, None]:
         """Starts the game by setting the scene and giving 4 options"""
         try:
@@ -126,7 +146,7 @@ class GameState:
                 logger.warning("Empty GM response, using fallback")
 
             self.gm_history.append({"role": "assistant", "content": streamed_response})
-            self.conversation.append(("GM", streamed_response))
+            self.append_message("GM", streamed_response)
             self.chat_logger.append_message("GM", streamed_response)
 
             # Final yield with empty content to signal completion (content already streamed)
@@ -137,18 +157,16 @@ class GameState:
             self.chat_logger.append_system_message(f"Error starting game: {str(e)}")
             yield False, [], f"{ErrorMessages.GAME_START}: {str(e)}"
 
+    # Trailing phrases that indicate the model stopped mid-sentence
+    _INCOMPLETE_ENDINGS = ("barely above a", "he says as he", "she whispers as", "you notice that", "in the distance you can", "suddenly you hear")
+
     def _is_response_complete(self, response: str) -> bool:
         if not response or len(response.strip()) < 10:
             return False
         stripped = response.rstrip()
         if not stripped.endswith(('.', '!', '?', '"', "'", ')', ']')):
             return False
-        incomplete_patterns = ["barely above a", "he says as he", "she whispers as", "you notice that", "in the distance you can", "suddenly you hear"]
-        lower_response = response.lower()
-        for pattern in incomplete_patterns:
-            if lower_response.endswith(pattern):
-                return False
-        return True
+        return not response.lower().endswith(self._INCOMPLETE_ENDINGS)
 
     def take_step_streaming(self, player_choice: Optional[int] = None, max_steps: int = 50) -> Generator[Tuple[bool, List, int, str], None, None]:
         """Streaming player step with robust completion handling"""
@@ -158,7 +176,7 @@ class GameState:
                 player_choice = random.choice([1, 2, 3, 4])
 
             player_choice_str = str(player_choice)
-            self.conversation.append(("Player", player_choice_str))
+            self.append_message("Player", player_choice_str)
             self.chat_logger.append_message("Player", player_choice_str)
             yield True, self.conversation, player_choice, ""
 
@@ -198,7 +216,7 @@ Based on choice {player_choice}, provide a complete and satisfying ending that w
                     streamed_response += fallback
 
             self.gm_history.append({"role": "assistant", "content": streamed_response})
-            self.conversation.append(("GM", streamed_response))
+            self.append_message("GM", streamed_response)
             self.chat_logger.append_message("GM", streamed_response)
 
             self.chat_client.is_final_step = False
@@ -217,6 +235,7 @@ Based on choice {player_choice}, provide a complete and satisfying ending that w
 
     def reset(self):
         self.conversation.clear()
+        self.gradio_conversation.clear()
         self.step_count = 0
         self.gm_history = self.gm_history[:1]
         self.chat_logger.finalize_session()
@@ -226,19 +245,29 @@ Based on choice {player_choice}, provide a complete and satisfying ending that w
         self.chat_logger.finalize_session()
 
     def get_game_info(self) -> Dict[str, Any]:
-        return {
+        # Refreshing a debug panel should not rebuild the dict (and its
+        # getattr probes) when nothing happened; reuse the last result
+        # until the game or its client actually changes
+        watermark = (self.step_count, len(self.conversation), id(self.chat_client))
+        cached = getattr(self, "_info_cache", None)
+        if cached is not None and cached[0] == watermark:
+            return cached[1]
+
+        info = {
             "step_count": self.step_count,
             "total_messages": len(self.conversation),
             "gm_history_length": len(self.gm_history),
             "last_message": self.conversation[-1] if self.conversation else None,
             "session_log_file": str(self.chat_logger.session_file) if self.chat_logger.session_file else None,
             "chat_client_info": {
-                "api_url": getattr(self.chat_client, 'api_url', 'unknown'),
-                "model": getattr(self.chat_client, 'model', 'unknown'),
-                "provider": getattr(self.chat_client, 'api_provider', 'unknown'),
-                "is_final_step": getattr(self.chat_client, 'is_final_step', False)
+                "api_url": self.chat_client.api_url,
+                "model": self.chat_client.model,
+                "provider": self.chat_client.api_provider,
+                "is_final_step": self.chat_client.is_final_step
             }
         }
+        self._info_cache = (watermark, info)
+        return info
 
     def __del__(self):
         try:
@@ -273,15 +302,15 @@ class ConversationFormatter:
 
     @staticmethod
     def to_markdown(conversation: List[Tuple[str, str]]) -> str:
-        markdown = "# RPG Adventure Log\n\n"
+        # Build parts and join once; += on a long log is quadratic
+        parts = ["# RPG Adventure Log\n\n"]
         for speaker, content in conversation:
             prefix = "**Game Master:**" if speaker == "GM" else "**Player:**"
-            markdown += f"{prefix}\n{content}\n\n"
-        return markdown
+            parts.append(f"{prefix}\n{content}\n\n")
+        return "".join(parts)
 
     @staticmethod
     def to_plain_text(conversation: List[Tuple[str, str]]) -> str:
-        text = "RPG Adventure Log\n" + "=" * 50 + "\n\n"
-        for speaker, content in conversation:
-            text += f"{speaker}: {content}\n\n"
-        return text
+        parts = ["RPG Adventure Log\n" + "=" * 50 + "\n\n"]
+        parts.extend(f"{speaker}: {content}\n\n" for speaker, content in conversation)
+        return "".join(parts)
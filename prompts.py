@@ -1,5 +1,7 @@
 import os
-from typing import Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
 from config import Config
 
 
@@ -49,37 +51,45 @@ You are playing as a brave adventurer seeking fortune and glory."""
         player_prompt = cls.load_player_prompt()
         return gm_prompt, player_prompt
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _read_prompt_file(path: str, mtime: float) -> Optional[str]:
+        """Read a prompt file once per (path, mtime).
+
+        The mtime argument keys the cache: editing or saving a prompt file
+        changes it, so stale content is never served, while repeated game
+        starts skip the disk read entirely.
+        """
+        return Path(path).read_text(encoding="utf-8").strip() or None
+
     @classmethod
-    def load_gm_prompt(cls) -> str:
-        """Load GM prompt from file or return default"""
+    def _load_prompt(cls, filename: str, default: str, label: str) -> str:
+        """Load a prompt from file (cached) or return the default"""
         try:
-            gm_prompt_path = os.path.join(Config.PROMPTS_DIR, Config.GM_PROMPT_FILE)
-            if os.path.exists(gm_prompt_path):
-                with open(gm_prompt_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        return content
+            path = os.path.join(Config.PROMPTS_DIR, filename)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                return default
+            content = cls._read_prompt_file(path, mtime)
+            if content:
+                return content
         except Exception as e:
-            print(f"Warning: Could not load GM prompt from file: {e}")
+            print(f"Warning: Could not load {label} prompt from file: {e}")
 
-        return cls.DEFAULT_GM_PROMPT
+        return default
+
+    @classmethod
+    def load_gm_prompt(cls) -> str:
+        """Load GM prompt from file or return default"""
+        return cls._load_prompt(Config.GM_PROMPT_FILE, cls.DEFAULT_GM_PROMPT, "GM")
 
     @classmethod
     def load_player_prompt(cls) -> str:
         """Load player prompt from file or return default"""
-        try:
-            player_prompt_path = os.path.join(
-                Config.PROMPTS_DIR, Config.PLAYER_PROMPT_FILE
-            )
-            if os.path.exists(player_prompt_path):
-                with open(player_prompt_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        return content
-        except Exception as e:
-            print(f"Warning: Could not load player prompt from file: {e}")
-
-        return cls.DEFAULT_PLAYER_PROMPT
+        return cls._load_prompt(
+            Config.PLAYER_PROMPT_FILE, cls.DEFAULT_PLAYER_PROMPT, "player"
+        )
 
     @classmethod
     def save_prompt(cls, content: str, prompt_type: str) -> bool:
@@ -47,9 +47,14 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 function setupEventListeners() {
-    // Provider change
+    // Provider change (debounced: flicking through the list with the
+    // keyboard only fetches the config for the final selection)
+    let providerChangeTimer = null;
     providerSelect.addEventListener('change', () => {
-        loadProviderModels(providerSelect.value);
+        clearTimeout(providerChangeTimer);
+        providerChangeTimer = setTimeout(() => {
+            loadProviderModels(providerSelect.value);
+        }, 150);
     });
 
     // Slider updates
@@ -402,6 +407,9 @@ async function autoplay() {
                             lastMessageType = 'step_done';
                             currentContent = '';
                             gameStarted = true;
+                        } else if (data.type === 'wait') {
+                            // Server sends the pause as a hint instead of sleeping
+                            await new Promise(resolve => setTimeout(resolve, data.ms));
                         } else if (data.type === 'complete') {
                             storyComplete = true;
                             setStatus(`<strong>Status:</strong> Auto-play complete! (${data.step} steps) - Click "Continue Story" to keep playing`);
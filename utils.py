@@ -1,5 +1,12 @@
 # utils.py
 
+import re
+
+# Numbered option marker ("1." / "1)") at the start of a line. The options
+# always sit at the end of the GM response, so validation only scans the tail.
+_OPTION_PATTERN = re.compile(r"(?m)^\s*([1-4])[.)]")
+_VALIDATE_TAIL_CHARS = 400
+
 
 def conv_to_gradio_format(conv_list):
     """Convert internal conversation format to Gradio messages format"""
@@ -16,8 +23,6 @@ def validate_gm_response(response):
     """Check if GM response has at least 4 numbered options"""
     if not response:
         return False
-    count = 0
-    for i in range(1, 5):
-        if f"{i}." in response or f"{i})" in response:
-            count += 1
-    return count >= 4
+    tail = response[-_VALIDATE_TAIL_CHARS:]
+    found = set(_OPTION_PATTERN.findall(tail))
+    return len(found) >= 4